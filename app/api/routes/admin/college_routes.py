@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -42,8 +42,18 @@ async def create_college(
     dependencies=[Depends(require_permission("view", "colleges"))]
 )
 async def list_colleges(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
+    # Revalidation: ETag from max(updated_at) + row count — on a match
+    # the client gets a 304 with no list query and no body serialized
+    etag = f'"{await service.get_colleges_etag(db)}"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    response.headers["ETag"] = etag
     return await service.list_colleges(db)
 
 
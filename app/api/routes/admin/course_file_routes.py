@@ -5,9 +5,10 @@ from fastapi import (
     UploadFile,
     File,
     Request,
+    Response,
     status,
 )
-from fastapi.responses import RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -67,6 +68,7 @@ async def upload_course_file(
 async def list_course_files(
     course_id: int,
     request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
 ):
     if request.state.user["role"] != "ADMIN":
@@ -75,13 +77,21 @@ async def list_course_files(
             detail="Admin access only"
         )
 
+    # Revalidation: ETag from max(updated_at) + row count — on a match
+    # the client gets a 304 with no list query and no body serialized
+    etag = f'"{await service.get_course_files_etag(db, course_id)}"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+
+    response.headers["ETag"] = etag
     return await service.list_course_files(db, course_id)
 
 
 # -------------------------------------------------
 # LIST ONLY PDFs FOR A COURSE
 # -------------------------------------------------
-@router.get("/{course_id}/pdfs")
+@router.get("/{course_id}/pdfs", response_class=ORJSONResponse)
 async def list_course_pdfs(
     course_id: int,
     request: Request,
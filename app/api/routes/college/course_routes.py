@@ -1,6 +1,8 @@
 from fastapi import APIRouter, Depends, Request, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.utils.response import RowORJSONResponse
+
 from app.core.database import get_db
 from app.services.college.course_service import CollegeCourseService
 from app.schemas.enrollment_schema import (
@@ -69,7 +71,10 @@ async def list_college_courses(
 # -------------------------------------------------
 # LIST AVAILABLE COURSES FOR COLLEGE
 # -------------------------------------------------
-@router.get("/courses")
+# orjson serializes the payload in C (and handles datetime natively);
+# RowORJSONResponse shapes each course row during encoding so the
+# service never materializes an intermediate list of dicts
+@router.get("/courses", response_class=RowORJSONResponse)
 async def list_admin_courses_for_college(
     request: Request,
     db: AsyncSession = Depends(get_db)
@@ -82,7 +87,9 @@ async def list_admin_courses_for_college(
             detail="College admin access only"
         )
 
-    return await service.get_admin_courses_for_college(
-        db=db,
-        college_admin_user=user
+    return RowORJSONResponse(
+        await service.get_admin_courses_for_college(
+            db=db,
+            college_admin_user=user
+        )
     )
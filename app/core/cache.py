@@ -0,0 +1,44 @@
+import orjson
+from redis import asyncio as aioredis
+
+from app.core.config import settings
+
+# -----------------------------
+# REDIS RESPONSE CACHE (OPTIONAL)
+# -----------------------------
+# Without REDIS_URL every helper is a no-op and reads fall through to
+# the database. Redis errors are swallowed for the same reason — the
+# cache must never take an endpoint down with it.
+_client = (
+    aioredis.from_url(settings.REDIS_URL)
+    if settings.REDIS_URL
+    else None
+)
+
+
+async def cache_get(key: str):
+    if _client is None:
+        return None
+    try:
+        blob = await _client.get(key)
+    except Exception:
+        return None
+    return orjson.loads(blob) if blob is not None else None
+
+
+async def cache_set(key: str, value, ttl: int = 30) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.set(key, orjson.dumps(value), ex=ttl)
+    except Exception:
+        pass
+
+
+async def cache_delete(*keys: str) -> None:
+    if _client is None or not keys:
+        return
+    try:
+        await _client.delete(*keys)
+    except Exception:
+        pass
@@ -20,6 +20,11 @@ class Settings(BaseSettings):
     AWS_S3_BUCKET: Optional[str] = None
     AWS_S3_COURSE_PREFIX: str = "Courses"
 
+    # -----------------------------
+    # REDIS (OPTIONAL — RESPONSE CACHE)
+    # -----------------------------
+    REDIS_URL: Optional[str] = None
+
     # -----------------------------
     # APP
     # -----------------------------
@@ -27,6 +27,20 @@ DATABASE_URL = (
     f"@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 )
 
+# -----------------------------
+# POOL TUNING (ENV OVERRIDABLE)
+# -----------------------------
+# Defaults match the previous hardcoded values; override per deployment.
+# Behind an external pooler (PgBouncer/ProxySQL) set DB_POOL_PRE_PING=false
+# to avoid per-checkout ping round-trips.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in (
+    "1", "true", "yes"
+)
+
 # -----------------------------
 # ASYNC ENGINE (STABLE CONFIG)
 # -----------------------------
@@ -35,11 +49,11 @@ engine = create_async_engine(
     echo=False,
 
     # 🔥 REQUIRED FOR MYSQL STABILITY (Windows Safe)
-    pool_pre_ping=True,     # checks connection before use
-    pool_recycle=1800,      # recycle before MySQL timeout
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
+    pool_pre_ping=DB_POOL_PRE_PING,   # checks connection before use
+    pool_recycle=DB_POOL_RECYCLE,     # recycle before MySQL timeout
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
 )
 
 # -----------------------------
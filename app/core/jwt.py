@@ -1,5 +1,7 @@
 from datetime import datetime, timedelta
-from jose import jwt, JWTError
+
+import jwt
+from jwt import PyJWTError
 
 from app.core.config import settings
 
@@ -31,8 +33,9 @@ def decode_access_token(token: str) -> dict | None:
         payload = jwt.decode(
             token,
             settings.SECRET_KEY,
-            algorithms=[ALGORITHM]
+            algorithms=[ALGORITHM],
+            options={"require": ["exp", "sub"]}
         )
         return payload
-    except JWTError:
+    except PyJWTError:
         return None
@@ -1,6 +1,8 @@
 import boto3
 import uuid
+from boto3.s3.transfer import TransferConfig
 from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
 from app.core.config import settings
 
 s3_client = boto3.client(
@@ -10,22 +12,37 @@ s3_client = boto3.client(
     region_name=settings.AWS_REGION,
 )
 
+# Stream uploads as 8 MB multipart chunks instead of buffering whole files
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+
 async def upload_file_to_s3(
     file: UploadFile,
     folder: str,
 ):
-    # Read file bytes
-    file_bytes = await file.read()
-
     key = f"{folder}/{uuid.uuid4()}_{file.filename}"
 
-    # Upload to S3 (INLINE VIEW)
-    s3_client.put_object(
-        Bucket=settings.AWS_S3_BUCKET,
-        Key=key,
-        Body=file_bytes,
-        ContentType=file.content_type,
-        ContentDisposition="inline",  # 👈 IMPORTANT
+    # File size via seek/tell — no need to read the body into memory
+    body = file.file
+    body.seek(0, 2)
+    file_size = body.tell()
+    body.seek(0)
+
+    # upload_fileobj streams chunks straight from the spooled file;
+    # run it in a worker thread so it never blocks the event loop
+    await run_in_threadpool(
+        s3_client.upload_fileobj,
+        body,
+        settings.AWS_S3_BUCKET,
+        key,
+        ExtraArgs={
+            "ContentType": file.content_type,
+            "ContentDisposition": "inline",  # 👈 IMPORTANT (INLINE VIEW)
+        },
+        Config=_TRANSFER_CONFIG,
     )
 
     file_url = (
@@ -35,7 +52,15 @@ async def upload_file_to_s3(
 
     return {
         "file_url": file_url,
-        "file_size": len(file_bytes),
+        "file_size": file_size,
         "content_type": file.content_type,
         "s3_key": key,
     }
+
+
+async def delete_file_from_s3(key: str):
+    await run_in_threadpool(
+        s3_client.delete_object,
+        Bucket=settings.AWS_S3_BUCKET,
+        Key=key,
+    )
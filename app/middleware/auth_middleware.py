@@ -1,7 +1,12 @@
+import hashlib
+import re
+import time
+from collections import OrderedDict
+
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from jose import JWTError
+from jwt import PyJWTError
 
 from app.core.jwt import decode_access_token
 
@@ -13,13 +18,67 @@ PUBLIC_PATHS = (
     "/health",
 )
 
+# Single compiled prefix match (one C-level check per request instead of
+# one startswith per public path)
+_PUBLIC_RE = re.compile(
+    "^(?:" + "|".join(re.escape(p) for p in PUBLIC_PATHS) + ")(?:/|$)"
+)
+
+# ------------------------------------------------
+# DECODED-TOKEN CACHE (AVOID RE-VERIFYING HOT JWTs)
+# ------------------------------------------------
+# sha256(token) -> (monotonic deadline, payload)
+# Keyed by token hash so raw tokens never sit in memory.
+_TOKEN_CACHE: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+_TOKEN_CACHE_MAX = 10_000
+_TOKEN_CACHE_TTL = 300       # cap, seconds (never past token exp)
+_TOKEN_CACHE_SWEEP = 600     # expired-entry sweep interval, seconds
+
+_next_sweep = time.monotonic() + _TOKEN_CACHE_SWEEP
+
+
+def _cache_get(key: str) -> dict | None:
+    entry = _TOKEN_CACHE.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    _TOKEN_CACHE.move_to_end(key)  # LRU refresh
+    return entry[1]
+
+
+def _cache_put(key: str, payload: dict) -> None:
+    global _next_sweep
+
+    now = time.monotonic()
+    exp = payload.get("exp")
+
+    ttl = _TOKEN_CACHE_TTL
+    if exp is not None:
+        ttl = min(ttl, exp - time.time())
+    if ttl <= 0:
+        return
+
+    _TOKEN_CACHE[key] = (now + ttl, payload)
+    _TOKEN_CACHE.move_to_end(key)
+
+    # Bound the cache (LRU) and periodically drop expired entries
+    while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+        _TOKEN_CACHE.popitem(last=False)
+
+    if now >= _next_sweep:
+        _next_sweep = now + _TOKEN_CACHE_SWEEP
+        for k in [k for k, v in _TOKEN_CACHE.items() if v[0] <= now]:
+            del _TOKEN_CACHE[k]
+
 
 class AuthMiddleware(BaseHTTPMiddleware):
 
     async def dispatch(self, request: Request, call_next):
 
-        path = request.url.path
-        method = request.method
+        # Read straight from the ASGI scope — request.url would build and
+        # parse a URL object on every request just to get the path back
+        scope = request.scope
+        path = scope["path"]
+        method = scope["method"]
 
         # ------------------------------------------------
         # ✅ ALLOW OPTIONS (CORS PREFLIGHT)
@@ -30,7 +89,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         # ------------------------------------------------
         # ✅ ALLOW PUBLIC ROUTES
         # ------------------------------------------------
-        if any(path.startswith(p) for p in PUBLIC_PATHS):
+        if _PUBLIC_RE.match(path):
             return await call_next(request)
 
         # ------------------------------------------------
@@ -44,18 +103,26 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 content={"detail": "Authentication required"},
             )
 
-        token = auth_header.split(" ", 1)[1]
+        # Prefix already validated above — slice past "Bearer " directly
+        token = auth_header[7:]
 
         # ------------------------------------------------
-        # DECODE TOKEN (SAFE)
+        # DECODE TOKEN (SAFE, CACHED)
         # ------------------------------------------------
-        try:
-            payload = decode_access_token(token)
-        except JWTError:
-            return JSONResponse(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                content={"detail": "Invalid or expired token"},
-            )
+        cache_key = hashlib.sha256(token.encode()).hexdigest()
+        payload = _cache_get(cache_key)
+
+        if payload is None:
+            try:
+                payload = decode_access_token(token)
+            except PyJWTError:
+                return JSONResponse(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    content={"detail": "Invalid or expired token"},
+                )
+
+            if payload:
+                _cache_put(cache_key, payload)
 
         if not payload or "sub" not in payload:
             return JSONResponse(
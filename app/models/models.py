@@ -497,14 +497,23 @@ class Course(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
     # ✅ Relationships
+    # lazy="raise" on the collections: accidental per-row lazy loads
+    # (the N+1 pattern) fail loudly — eager load with selectinload()
+    # where nested data is actually needed
     college_courses = relationship(
         "CollegeCourse",
         back_populates="course",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy="raise"
     )
 
     teacher = relationship("Teacher", back_populates="courses")
-    files = relationship("CourseFile", back_populates="course", cascade="all, delete-orphan")
+    files = relationship(
+        "CourseFile",
+        back_populates="course",
+        cascade="all, delete-orphan",
+        lazy="raise"
+    )
     tests = relationship("Test", back_populates="course", cascade="all, delete-orphan")
     student_enrollments = relationship("StudentCourse", back_populates="course")
 
@@ -1,10 +1,17 @@
-from sqlalchemy import select
+import hashlib
+
+from sqlalchemy import func, lambda_stmt, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.models.models import College
+from app.core.cache import cache_delete, cache_get, cache_set
+from app.models.models import College, CollegeAdmin, CollegeCourse, Course
 from app.schemas.college_schema import CollegeCreate, CollegeUpdate
 
+_COLLEGES_CACHE_KEY = "colleges:active:v1"
+_COLLEGES_CACHE_TTL = 30  # seconds
+
 
 class AdminCollegeService:
     """
@@ -20,16 +27,6 @@ class AdminCollegeService:
         payload: CollegeCreate
     ) -> College:
 
-        # Prevent duplicate college code
-        existing = await db.scalar(
-            select(College).where(College.code == payload.code)
-        )
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="College with this code already exists"
-            )
-
         college = College(
             name=payload.name,
             code=payload.code,
@@ -45,20 +42,75 @@ class AdminCollegeService:
         )
 
         db.add(college)
-        await db.commit()
-        await db.refresh(college)
+
+        # Duplicate codes are rejected by the uq_college_code constraint —
+        # no pre-insert SELECT, no check-then-insert race
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="College with this code already exists"
+            )
+
+        # No refresh needed: expire_on_commit=False keeps attributes
+        # live, the id is populated on flush, and created_at/updated_at
+        # are Python-side defaults already set on the instance
+        await cache_delete(_COLLEGES_CACHE_KEY)
         return college
 
     # -------------------------------------------------
     # LIST COLLEGES (ACTIVE ONLY)
     # -------------------------------------------------
     async def list_colleges(self, db: AsyncSession):
-        result = await db.execute(
-            select(College)
+        # Hot read: try Redis first, fall through to the DB on miss
+        cached = await cache_get(_COLLEGES_CACHE_KEY)
+        if cached is not None:
+            return cached
+
+        # Column-tuple select: no mapped instances, no identity-map
+        # bookkeeping — rows go straight to plain dicts.
+        # lambda_stmt caches the compiled SQL across calls.
+        stmt = lambda_stmt(
+            lambda: select(
+                College.id,
+                College.name,
+                College.code,
+                College.description,
+                College.email,
+                College.phone,
+                College.website,
+                College.city,
+                College.state,
+                College.country,
+                College.established_year,
+                College.is_active,
+                College.created_at,
+            )
             .where(College.is_active.is_(True))
             .order_by(College.created_at.desc())
         )
-        return result.scalars().all()
+        result = await db.execute(stmt)
+        colleges = [dict(row._mapping) for row in result.all()]
+
+        await cache_set(_COLLEGES_CACHE_KEY, colleges, _COLLEGES_CACHE_TTL)
+        return colleges
+
+    # -------------------------------------------------
+    # LIST ETAG (CHEAP CHANGE FINGERPRINT FOR 304s)
+    # -------------------------------------------------
+    async def get_colleges_etag(self, db: AsyncSession) -> str:
+        row = (
+            await db.execute(
+                select(
+                    func.max(College.updated_at),
+                    func.count(College.id)
+                )
+                .where(College.is_active.is_(True))
+            )
+        ).one()
+        return hashlib.sha256(f"{row[0]}:{row[1]}".encode()).hexdigest()
 
     # -------------------------------------------------
     # GET COLLEGE BY ID (ADMIN – ACTIVE / INACTIVE)
@@ -68,9 +120,11 @@ class AdminCollegeService:
         db: AsyncSession,
         college_id: int
     ) -> College | None:
-        return await db.scalar(
-            select(College).where(College.id == college_id)
+        # college_id is tracked as a bind parameter by lambda_stmt
+        stmt = lambda_stmt(
+            lambda: select(College).where(College.id == college_id)
         )
+        return await db.scalar(stmt)
 
     # -------------------------------------------------
     # UPDATE COLLEGE
@@ -89,13 +143,13 @@ class AdminCollegeService:
                 detail="College not found"
             )
 
-        update_data = payload.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            setattr(college, field, value)
+        # Copy only the fields the client actually sent — no intermediate
+        # model_dump dict allocation
+        for field in payload.__pydantic_fields_set__:
+            setattr(college, field, getattr(payload, field))
 
         await db.commit()
-        await db.refresh(college)
+        await cache_delete(_COLLEGES_CACHE_KEY)
         return college
 
     # -------------------------------------------------
@@ -107,65 +161,85 @@ class AdminCollegeService:
         college_id: int
     ) -> None:
 
-        college = await self.get_college(db, college_id)
-        if not college or not college.is_active:
+        # Single UPDATE — no row fetch, no ORM instance. rowcount tells
+        # us whether an active college matched (MySQL has no RETURNING)
+        result = await db.execute(
+            update(College)
+            .where(
+                College.id == college_id,
+                College.is_active.is_(True)
+            )
+            .values(is_active=False)
+        )
+
+        if result.rowcount == 0:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="College not found"
             )
 
-        college.is_active = False
         await db.commit()
+        await cache_delete(_COLLEGES_CACHE_KEY)
 
     async def get_admin_courses_for_college(
         self,
         db: AsyncSession,
         college_admin_user: dict
     ):
-        # 1️⃣ Get college_id from college_admin
+        # 1️⃣ Single JOIN: admin → college → courses (one round-trip),
+        # selecting only the columns the response needs
         result = await db.execute(
-            select(CollegeAdmin)
-            .where(CollegeAdmin.user_id == college_admin_user["id"])
-        )
-        college_admin = result.scalar_one_or_none()
-
-        if not college_admin:
-            raise HTTPException(
-                status_code=404,
-                detail="College admin record not found"
+            select(
+                Course.id.label("course_id"),
+                Course.title,
+                Course.category,
+                Course.level,
+                Course.description,
+                Course.thumbnail_url,
+                Course.duration_hours,
+                Course.expected_completion_days,
+                Course.created_at,
+                CollegeAdmin.college_id,
+            )
+            .join(CollegeCourse, CollegeCourse.course_id == Course.id)
+            .join(
+                CollegeAdmin,
+                CollegeAdmin.college_id == CollegeCourse.college_id
             )
-
-        college_id = college_admin.college_id
-
-        # 2️⃣ Fetch ADMIN-provided courses for this college
-        result = await db.execute(
-            select(Course)
             .where(
-                Course.college_id == college_id,
-                Course.is_active == True,
-                Course.is_published == True
+                CollegeAdmin.user_id == college_admin_user["id"],
+                Course.is_active.is_(True),
+                Course.is_published.is_(True)
             )
             .order_by(Course.created_at.desc())
         )
 
-        courses = result.scalars().all()
+        rows = result.all()
+
+        if rows:
+            college_id = rows[0].college_id
+        else:
+            # 2️⃣ No rows: distinguish "no courses" from "not an admin"
+            college_id = await db.scalar(
+                select(CollegeAdmin.college_id)
+                .where(CollegeAdmin.user_id == college_admin_user["id"])
+            )
+            if college_id is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail="College admin record not found"
+                )
+
+        # 3️⃣ Response shaping — columns are already labelled to match
+        # the response keys
+        courses = []
+        for row in rows:
+            course = dict(row._mapping)
+            course.pop("college_id")
+            courses.append(course)
 
-        # 3️⃣ Response shaping
         return {
             "college_id": college_id,
             "total_courses": len(courses),
-            "courses": [
-                {
-                    "course_id": course.id,
-                    "title": course.title,
-                    "category": course.category,
-                    "level": course.level,
-                    "description": course.description,
-                    "thumbnail_url": course.thumbnail_url,
-                    "duration_hours": course.duration_hours,
-                    "expected_completion_days": course.expected_completion_days,
-                    "created_at": course.created_at,
-                }
-                for course in courses
-            ]
+            "courses": courses
         }
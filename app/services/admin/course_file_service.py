@@ -1,9 +1,24 @@
+import asyncio
+import hashlib
+
 from fastapi import UploadFile, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, lambda_stmt, select
 
 from app.models.models import Course, CourseFile
-from app.core.s3 import upload_file_to_s3
+from app.core.cache import cache_delete, cache_get, cache_set
+from app.core.s3 import delete_file_from_s3, upload_file_to_s3
+
+# Content-type → stored file_type (single place to extend)
+_TYPE_MAP = {
+    "application/pdf": "PDF",
+}
+
+_FILES_CACHE_TTL = 30  # seconds
+
+
+def _files_cache_key(course_id: int) -> str:
+    return f"course_files:{course_id}:v1"
 
 
 class AdminCourseFileService:
@@ -18,33 +33,29 @@ class AdminCourseFileService:
         duration_seconds: int | None,
     ):
         # --------------------------------------------------
-        # 1️⃣ Validate Course
+        # 1️⃣ + 2️⃣ Validate Course & upload to S3 concurrently
+        # (no data dependency — S3 latency overlaps DB round-trip)
         # --------------------------------------------------
-        result = await db.execute(
-            select(Course).where(Course.id == course_id)
+        course_exists, s3_result = await asyncio.gather(
+            db.scalar(select(Course.id).where(Course.id == course_id)),
+            upload_file_to_s3(
+                file=file,
+                folder=f"Courses/{course_id}"
+            ),
         )
-        course = result.scalar_one_or_none()
 
-        if not course:
+        if course_exists is None:
+            # Course check failed — clean up the orphan S3 object
+            await delete_file_from_s3(s3_result["s3_key"])
             raise HTTPException(status_code=404, detail="Course not found")
 
-        # --------------------------------------------------
-        # 2️⃣ Upload file to S3 (INLINE VIEW ENABLED)
-        # --------------------------------------------------
-        s3_result = await upload_file_to_s3(
-            file=file,
-            folder=f"Courses/{course_id}"
-        )
-
         # --------------------------------------------------
         # 3️⃣ Detect file type
         # --------------------------------------------------
-        if file.content_type == "application/pdf":
-            file_type = "PDF"
-        elif file.content_type and file.content_type.startswith("video/"):
-            file_type = "VIDEO"
-        else:
-            file_type = "DOCUMENT"
+        content_type = file.content_type or ""
+        file_type = _TYPE_MAP.get(content_type) or (
+            "VIDEO" if content_type.startswith("video/") else "DOCUMENT"
+        )
 
         # --------------------------------------------------
         # 4️⃣ Save DB record
@@ -67,6 +78,7 @@ class AdminCourseFileService:
         await db.commit()
         await db.refresh(course_file)
 
+        await cache_delete(_files_cache_key(course_id))
         return course_file
 
     # --------------------------------------------------
@@ -77,62 +89,46 @@ class AdminCourseFileService:
         db: AsyncSession,
         course_id: int
     ):
-        result = await db.execute(
-            select(CourseFile)
+        # Hot read: try Redis first, fall through to the DB on miss
+        cache_key = _files_cache_key(course_id)
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Column-tuple select (no mapped instances); lambda_stmt caches
+        # the compiled SQL and course_id stays a bind param
+        stmt = lambda_stmt(
+            lambda: select(
+                CourseFile.id,
+                CourseFile.course_id,
+                CourseFile.file_name,
+                CourseFile.file_url,
+                CourseFile.created_at,
+            )
             .where(CourseFile.course_id == course_id)
             .order_by(CourseFile.created_at.desc())
         )
-        return result.scalars().all()
+        result = await db.execute(stmt)
+        files = [dict(row._mapping) for row in result.all()]
+
+        await cache_set(cache_key, files, _FILES_CACHE_TTL)
+        return files
 
-    async def get_admin_courses_for_college(
+    # --------------------------------------------------
+    # LIST ETAG (CHEAP CHANGE FINGERPRINT FOR 304s)
+    # --------------------------------------------------
+    async def get_course_files_etag(
         self,
         db: AsyncSession,
-        college_admin_user: dict
-    ):
-        # 1️⃣ Get college_id from college_admin
-        result = await db.execute(
-            select(CollegeAdmin)
-            .where(CollegeAdmin.user_id == college_admin_user["id"])
-        )
-        college_admin = result.scalar_one_or_none()
-
-        if not college_admin:
-            raise HTTPException(
-                status_code=404,
-                detail="College admin record not found"
-            )
-
-        college_id = college_admin.college_id
-
-        # 2️⃣ Fetch ADMIN-provided courses for this college
-        result = await db.execute(
-            select(Course)
-            .where(
-                Course.college_id == college_id,
-                Course.is_active == True,
-                Course.is_published == True
+        course_id: int
+    ) -> str:
+        row = (
+            await db.execute(
+                select(
+                    func.max(CourseFile.updated_at),
+                    func.count(CourseFile.id)
+                )
+                .where(CourseFile.course_id == course_id)
             )
-            .order_by(Course.created_at.desc())
-        )
-
-        courses = result.scalars().all()
-
-        # 3️⃣ Response shaping
-        return {
-            "college_id": college_id,
-            "total_courses": len(courses),
-            "courses": [
-                {
-                    "course_id": course.id,
-                    "title": course.title,
-                    "category": course.category,
-                    "level": course.level,
-                    "description": course.description,
-                    "thumbnail_url": course.thumbnail_url,
-                    "duration_hours": course.duration_hours,
-                    "expected_completion_days": course.expected_completion_days,
-                    "created_at": course.created_at,
-                }
-                for course in courses
-            ]
-        }
+        ).one()
+        return hashlib.sha256(f"{row[0]}:{row[1]}".encode()).hexdigest()
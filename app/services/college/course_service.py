@@ -202,8 +202,21 @@ class CollegeCourseService:
 
         college_id = college_admin.college_id
 
+        # Columns labelled to match the response keys; rows go to the
+        # client untouched — RowORJSONResponse shapes each one during
+        # encoding, so no intermediate list of dicts is built here
         result = await db.execute(
-            select(Course)
+            select(
+                Course.id.label("course_id"),
+                Course.title,
+                Course.category,
+                Course.level,
+                Course.description,
+                Course.thumbnail_url,
+                Course.duration_hours,
+                Course.expected_completion_days,
+                Course.created_at,
+            )
             .join(CollegeCourse)
             .where(
                 CollegeCourse.college_id == college_id,
@@ -214,23 +227,10 @@ class CollegeCourseService:
             .order_by(Course.created_at.desc())
         )
 
-        courses = result.scalars().all()
+        courses = result.all()
 
         return {
             "college_id": college_id,
             "total_courses": len(courses),
-            "courses": [
-                {
-                    "course_id": c.id,
-                    "title": c.title,
-                    "category": c.category,
-                    "level": c.level,
-                    "description": c.description,
-                    "thumbnail_url": c.thumbnail_url,
-                    "duration_hours": c.duration_hours,
-                    "expected_completion_days": c.expected_completion_days,
-                    "created_at": c.created_at,
-                }
-                for c in courses
-            ]
+            "courses": courses
         }
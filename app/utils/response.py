@@ -0,0 +1,21 @@
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class RowORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse that knows how to serialize SQLAlchemy Row objects
+    through their mappings. Endpoints can pass query rows straight into
+    the payload — each row is shaped during encoding instead of being
+    copied into an intermediate list of dicts first.
+    """
+
+    @staticmethod
+    def _default(obj):
+        mapping = getattr(obj, "_mapping", None)
+        if mapping is not None:
+            return dict(mapping)
+        raise TypeError
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=self._default)